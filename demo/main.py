@@ -1,4 +1,3 @@
-import json
 from pathlib import Path
 
 from pydantic import TypeAdapter
@@ -6,29 +5,28 @@ from textual import on, work
 from textual.app import App, ComposeResult
 from textual.containers import Horizontal
 from textual.driver import Driver
-from textual.widget import Widget
-from textual.widgets import Button, Label, ListItem, ListView, Pretty
+from textual.widget import AwaitMount, Widget
+from textual.widgets import Button, ListItem, ListView, Pretty, Static
 
 from demo.models import MyCar
-from ticklist import annotation_iterators, form
+from ticklist import form
 from ticklist.annotation_iterators import ANNOTATION_ITERATORS
 from ticklist.types import NO_VALUE
 
 
 def _list_item_for_car(car: MyCar) -> ListItem:
-    return ListItem(Label(car.customer_name))
+    return ListItem(Static(car.customer_name, markup=False))
 
 
 cars_adapter = TypeAdapter(list[MyCar])
+cars_file = Path(__file__).parent / "cars.json"
 
 
 def _save_cars(cars: list[MyCar]) -> None:
-    cars_file = Path(__file__).parent / "cars.json"
     cars_file.write_bytes(cars_adapter.dump_json(cars))
 
 
 def _load_cars() -> list[MyCar]:
-    cars_file = Path(__file__).parent / "cars.json"
     if not cars_file.exists():
         return []
     return cars_adapter.validate_json(cars_file.read_bytes())
@@ -41,6 +39,12 @@ class MyApp(App):
 
     cars: list[MyCar]
 
+    def __init__(self) -> None:
+        """Init."""
+        super().__init__()
+        # the list item of each car in `cars`, keyed on the id of the car.
+        self._car_items: dict[int, tuple[MyCar, ListItem]] = {}
+
     def compose(self) -> ComposeResult:
         self.cars = _load_cars()
         with Horizontal(id="buttons"):
@@ -49,7 +53,7 @@ class MyApp(App):
             yield Button("edit car", id="edit_car")
 
         with Horizontal():
-            yield ListView(*(_list_item_for_car(car) for car in self.cars), id="cars")
+            yield ListView(*self._list_items(), id="cars")
             yield Pretty({})
 
     @on(Button.Pressed, "#save_cars")
@@ -63,7 +67,7 @@ class MyApp(App):
         if car is None:
             return
         self.cars.append(car)
-        self._update_cars_view()
+        await self._update_cars_view()
 
     @on(Button.Pressed, "#edit_car")
     @work
@@ -77,7 +81,7 @@ class MyApp(App):
         if updated_car is None:
             return
         self.cars[idx] = updated_car
-        self._update_cars_view()
+        await self._update_cars_view()
 
     async def _manage_car(self, instance: MyCar | None = None) -> MyCar | None:
         if instance is None:
@@ -89,11 +93,52 @@ class MyApp(App):
             return car
         return None
 
-    def _update_cars_view(self) -> None:
+    def _list_items(self) -> list[ListItem]:
+        """Return a list item for each car, reusing the items of unchanged cars."""
+        car_items: dict[int, tuple[MyCar, ListItem]] = {}
+        for car in self.cars:
+            car_item = self._car_items.get(id(car))
+            if car_item is None or car_item[0] is not car:
+                car_item = (car, _list_item_for_car(car))
+            car_items[id(car)] = car_item
+        self._car_items = car_items
+        return [item for _, item in car_items.values()]
+
+    async def _update_cars_view(self) -> None:
         cars_view = self.query_one(ListView)
-        cars_view.clear()
-
-        cars_view.extend((_list_item_for_car(car) for car in self.cars))
+        mounted = list(cars_view.query(ListItem))
+        highlighted_index = cars_view.index
+        highlighted = cars_view.highlighted_child
+        items = self._list_items()
+
+        # only remove and mount the items that changed, without refreshing
+        # the screen in between.
+        with self.batch_update():
+            removed = cars_view.remove_items(
+                [idx for idx, item in enumerate(mounted) if item not in items]
+            )
+            mounts: list[AwaitMount] = []
+            previous: ListItem | None = None
+            for item in items:
+                if item not in mounted:
+                    if previous is not None:
+                        mounts.append(cars_view.mount(item, after=previous))
+                    elif mounted:
+                        mounts.append(cars_view.mount(item, before=0))
+                    else:
+                        mounts.append(cars_view.mount(item))
+                previous = item
+            # removing items shifts the index, so restore it afterwards.
+            await removed
+            for mount in mounts:
+                await mount
+
+            # keep the highlight on the same car. When that car itself was
+            # replaced, its new item takes over the highlight.
+            if highlighted in items:
+                cars_view.index = items.index(highlighted)
+            elif highlighted_index is not None and items:
+                cars_view.index = min(highlighted_index, len(items) - 1)
 
     @on(ListView.Highlighted)
     def _on_car_selected(self, event: ListView.Highlighted) -> None:
@@ -102,7 +147,7 @@ class MyApp(App):
             return
         car: MyCar = self.cars[idx]
 
-        jsonned_dict = json.loads(car.model_dump_json())
+        jsonned_dict = car.model_dump(mode="json")
 
         self.query_one(Pretty).update(jsonned_dict)
 
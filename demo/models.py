@@ -1,12 +1,13 @@
 from enum import Enum
 from typing import Annotated
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import ConfigDict
 
 from ticklist import tick_annotations as ta
+from ticklist.models import FormReadyModel
 
 
-class StrictModel(BaseModel):
+class StrictModel(FormReadyModel):
     model_config = ConfigDict(extra="forbid")
 
 
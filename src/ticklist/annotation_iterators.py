@@ -5,11 +5,12 @@ from __future__ import annotations
 import logging
 from datetime import datetime
 from enum import Enum
-from inspect import isclass
 from types import NoneType, UnionType
-from typing import Any, Collection, Iterable, Literal, get_args
+from typing import Annotated, Any, Collection, Iterable, Literal, Union
+from weakref import WeakKeyDictionary
 
 from pydantic import BaseModel
+from pydantic.fields import FieldInfo
 
 from ticklist import tick_annotations as ta
 from ticklist.field_data import (
@@ -24,10 +25,26 @@ from ticklist.field_data import (
     FieldDataForNoneValue,
     FieldDataForString,
 )
-from ticklist.types import AnnotationIterator
+from ticklist.types import NO_VALUE, AnnotationIterator
 
 _logger = logging.getLogger(__name__)
 
+ModelPlan = tuple[tuple[str, FieldInfo, tuple[FieldData, ...]], ...]
+"""Field name, field info and (value-less) field data of all fields of a model."""
+
+# The pipe-style union (`int | str`) and the `typing.Union`/`typing.Optional`
+# style union are instances of different classes.
+_UNION_TYPES: tuple[Any, ...] = (UnionType, type(Union[int, str]))
+_LITERAL_TYPES: tuple[Any, ...] = (type(Literal["x"]),)
+# `typing._AnnotatedAlias` is private. Take its class from an instance instead.
+_ANNOTATED_TYPES: tuple[Any, ...] = (type(Annotated[int, None]),)
+
+_MODEL_PLAN_CACHE: WeakKeyDictionary[
+    type[BaseModel], dict[tuple[AnnotationIterator, ...], ModelPlan]
+] = WeakKeyDictionary()
+# Like the plan cache, weakly keyed so it does not keep (model) classes alive.
+_CLASS_TAG_CACHE: WeakKeyDictionary[type, str | None] = WeakKeyDictionary()
+
 
 class StringAndLiteralAnnotationNotAllowed(Exception):
     """A combination of `Literal` and `str` is not allowed.
@@ -85,18 +102,65 @@ def field_data_from_annotation(
     """
     _tick_annotations = ta.to_tick_annotations(metadata)
 
-    field_data = tuple(
-        _iter_over_annotation(
-            annotation, key, value, default, annotation_iterators, _tick_annotations
-        )
+    field_data = field_data_list(
+        annotation, key, value, default, annotation_iterators, _tick_annotations
     )
 
-    _field_data_types = set((fd.__class__ for fd in field_data))
+    has_str = has_literal = False
+    for fd in field_data:
+        fd_class = type(fd)
+        if fd_class is FieldDataForString:
+            has_str = True
+        elif fd_class is FieldDataForLiteralValue:
+            has_literal = True
+        else:
+            continue
+        if has_str and has_literal:
+            raise StringAndLiteralAnnotationNotAllowed(annotation)
 
-    if ({FieldDataForString, FieldDataForLiteralValue}).issubset(_field_data_types):
-        raise StringAndLiteralAnnotationNotAllowed(annotation)
+    return tuple(field_data)
 
-    return field_data
+
+def plan_for_model(
+    model: type[BaseModel], annotation_iterators: Collection[AnnotationIterator]
+) -> ModelPlan:
+    """Return the field data of all fields of a pydantic model.
+
+    The field data is evaluated without a value (only defaults are taken into
+    account) and memoized per model, so the annotations of a model are walked
+    only once per process.
+
+    Args:
+        model: The pydantic model.
+        annotation_iterators: A collection of annotation iterators.
+
+    Returns:
+        A tuple of field name, field info and field data for each field.
+    """
+    iterators = tuple(annotation_iterators)
+    try:
+        return _MODEL_PLAN_CACHE[model][iterators]
+    except KeyError:
+        pass
+
+    plan = tuple(
+        (
+            field,
+            field_info,
+            field_data_from_annotation(
+                annotation=field_info.annotation,
+                key=field,
+                value=NO_VALUE,
+                default=field_info.default,
+                annotation_iterators=iterators,
+                metadata=field_info.metadata,
+            ),
+        )
+        for field, field_info in model.model_fields.items()
+    )
+    # only store a plan once it is built, so a failing model leaves no entry.
+    _MODEL_PLAN_CACHE.setdefault(model, {})[iterators] = plan
+    return plan
 
 
 def bool_type_iterator(
@@ -108,7 +172,8 @@ def bool_type_iterator(
 ) -> Iterable[tuple[Any, ta.TickAnnotations]]:
     """Yield values for a boolean annotation."""
     if annotation is bool:
-        _logger.debug("annotation: Bool %s", annotation)
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug("annotation: Bool %s", annotation)
         yield (
             FieldDataForBooleanValue.parse(True, key, value, default, metadata),
             metadata,
@@ -138,8 +203,9 @@ def enum_type_iterator(
     metadata: ta.TickAnnotations,
 ) -> Iterable[tuple[Any, ta.TickAnnotations]]:
     """Yield values for an enum annotation."""
-    if isclass(annotation) and issubclass(annotation, Enum):
-        _logger.debug("annotation: Enum class %s", annotation)
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug("annotation: Enum class %s", annotation)
         for anno in annotation:
             yield anno, metadata
 
@@ -153,7 +219,8 @@ def enum_item_type_iterator(
 ) -> Iterable[tuple[FieldDataForEnumValue, ta.TickAnnotations]]:
     """Yield value for an individual enum item."""
     if isinstance(annotation, Enum):
-        _logger.debug("annotation: Enum value %s", annotation)
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug("annotation: Enum value %s", annotation)
         yield (
             FieldDataForEnumValue.parse(annotation, key, value, default, metadata),
             metadata,
@@ -168,8 +235,9 @@ def datetime_type_iterator(
     metadata: ta.TickAnnotations,
 ) -> Iterable[tuple[FieldDataForDatetime, ta.TickAnnotations]]:
     """Yield value for a datetime annotation."""
-    if isclass(annotation) and issubclass(annotation, datetime):
-        _logger.debug("annotation: datetime %s", annotation)
+    if isinstance(annotation, type) and issubclass(annotation, datetime):
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug("annotation: datetime %s", annotation)
         yield (
             FieldDataForDatetime.parse(annotation, key, value, default, metadata),
             metadata,
@@ -184,12 +252,13 @@ def str_type_iterator(
     metadata: ta.TickAnnotations,
 ) -> Iterable[tuple[FieldDataForString, ta.TickAnnotations]]:
     """Yield value for a string annotation."""
+    # `str` itself is by far the most common case. Check it by identity first.
     if (
-        isclass(annotation)
-        and issubclass(annotation, str)
-        and "multiline" not in metadata
-    ):
-        _logger.debug("annotation: str %s", annotation)
+        annotation is str
+        or (isinstance(annotation, type) and issubclass(annotation, str))
+    ) and "multiline" not in metadata:
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug("annotation: str %s", annotation)
         yield (
             FieldDataForString.parse(annotation, key, value, default, metadata),
             metadata,
@@ -204,8 +273,13 @@ def multiline_type_iterator(
     metadata: ta.TickAnnotations,
 ) -> Iterable[tuple[FieldDataForMultilineString, ta.TickAnnotations]]:
     """Yield value for a multiline string annotation."""
-    if isclass(annotation) and issubclass(annotation, str) and "multiline" in metadata:
-        _logger.debug("annotation: Multiline str %s", annotation)
+    if (
+        isinstance(annotation, type)
+        and issubclass(annotation, str)
+        and "multiline" in metadata
+    ):
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug("annotation: Multiline str %s", annotation)
         yield (
             FieldDataForMultilineString.parse(
                 annotation, key, value, default, metadata
@@ -222,8 +296,11 @@ def int_type_iterator(
     metadata: ta.TickAnnotations,
 ) -> Iterable[tuple[FieldDataForInt, ta.TickAnnotations]]:
     """Yield value of an int annotation."""
-    if isclass(annotation) and issubclass(annotation, int):
-        _logger.debug("annotation: Int %s", annotation)
+    if annotation is int or (
+        isinstance(annotation, type) and issubclass(annotation, int)
+    ):
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug("annotation: Int %s", annotation)
         yield FieldDataForInt.parse(annotation, key, value, default, metadata), metadata
 
 
@@ -245,12 +322,10 @@ def union_type_iterator(
     # This at least appears when a Literal type is involved. This might change
     # in future python version, but for now, this union check looks for both
     # union styles.
-    if isinstance(annotation, UnionType) or getattr(annotation, "__name__", None) in (
-        "Optional",
-        "Union",
-    ):
-        _logger.debug("annotation: Union %s", annotation)
-        for arg in get_args(annotation):
+    if isinstance(annotation, _UNION_TYPES):
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug("annotation: Union %s", annotation)
+        for arg in annotation.__args__:
             yield arg, metadata
 
 
@@ -262,8 +337,9 @@ def model_type_iterator(
     metadata: ta.TickAnnotations,
 ) -> Iterable[Any]:
     """Yield value for a pydantic BaseModel annotation."""
-    if isclass(annotation) and issubclass(annotation, BaseModel):
-        _logger.debug("annotation: Basemodel %s", annotation)
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug("annotation: Basemodel %s", annotation)
         yield FieldDataForModel.parse(annotation, key, value, default, metadata), None
 
 
@@ -275,10 +351,10 @@ def literal_type_iterator(
     metadata: ta.TickAnnotations,
 ) -> Iterable[Any]:
     """Yield values for a Literal annotation."""
-    origin = getattr(annotation, "__origin__", None)
-    if origin is Literal:
-        _logger.debug("annotation: Literal definition %s", annotation)
-        for arg in get_args(annotation):
+    if isinstance(annotation, _LITERAL_TYPES):
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug("annotation: Literal definition %s", annotation)
+        for arg in annotation.__args__:
             yield arg, metadata
 
 
@@ -291,7 +367,8 @@ def literal_value_iterator(
 ) -> Iterable[tuple[FieldDataForLiteralValue, ta.TickAnnotations]]:
     """Yield values for a Literal Value annotation."""
     if isinstance(annotation, str):
-        _logger.debug("annotation: Literal value %s", annotation)
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug("annotation: Literal value %s", annotation)
         yield (
             FieldDataForLiteralValue.parse(annotation, key, value, default, metadata),
             metadata,
@@ -306,8 +383,7 @@ def annotated_iterator(
     metadata: ta.TickAnnotations,
 ) -> Iterable[tuple[Any, ta.TickAnnotations]]:
     """Yield values defined inside an annotation."""
-    nm = getattr(annotation, "__name__", None)
-    if nm == "Annotated":
+    if isinstance(annotation, _ANNOTATED_TYPES):
         _anno = annotation.__origin__
 
         _meta = metadata | ta.to_tick_annotations(annotation.__metadata__)
@@ -331,29 +407,143 @@ ANNOTATION_ITERATORS: tuple[AnnotationIterator, ...] = (
     annotated_iterator,
 )
 
-
-def _iter_over_annotation(
+# The default iterators, keyed by the tag `_classify` assigns to an annotation.
+_DISPATCH: dict[str, AnnotationIterator] = {
+    "bool": bool_type_iterator,
+    "none": none_type_iterator,
+    "enum_cls": enum_type_iterator,
+    "enum_val": enum_item_type_iterator,
+    "datetime": datetime_type_iterator,
+    "str": str_type_iterator,
+    "multiline": multiline_type_iterator,
+    "int": int_type_iterator,
+    "union": union_type_iterator,
+    "model": model_type_iterator,
+    "literal": literal_type_iterator,
+    "literal_val": literal_value_iterator,
+    "annotated": annotated_iterator,
+}
+# The dispatched iterator, followed by the other default iterators in order.
+_DISPATCH_CANDIDATES: dict[str, tuple[AnnotationIterator, ...]] = {
+    tag: (iterator, *(other for other in ANNOTATION_ITERATORS if other is not iterator))
+    for tag, iterator in _DISPATCH.items()
+}
+
+
+def _classify(annotation: Any, metadata: ta.TickAnnotations) -> str | None:
+    """Return the `_DISPATCH` tag of the default iterator handling the annotation.
+
+    The checks mirror the ones done by the iterators in `ANNOTATION_ITERATORS`
+    (and in the same order), but evaluate the annotation only once.
+    """
+    if annotation is str:
+        return "multiline" if "multiline" in metadata else "str"
+    if annotation is int:
+        return "int"
+    if isinstance(annotation, type):
+        tag = _classify_class(annotation)
+        if tag == "str" and "multiline" in metadata:
+            return "multiline"
+        return tag
+    if isinstance(annotation, Enum):
+        return "enum_val"
+    if isinstance(annotation, _UNION_TYPES):
+        return "union"
+    if isinstance(annotation, _LITERAL_TYPES):
+        return "literal"
+    if isinstance(annotation, str):
+        return "literal_val"
+    if isinstance(annotation, _ANNOTATED_TYPES):
+        return "annotated"
+    return None
+
+
+def _classify_class(cls: type) -> str | None:
+    # What kind of class an annotation is does not change. Evaluate
+    # the subclass checks for a class only once.
+    try:
+        return _CLASS_TAG_CACHE[cls]
+    except KeyError:
+        tag = _CLASS_TAG_CACHE[cls] = _class_tag(cls)
+        return tag
+    except TypeError:
+        # unhashable class (through its metaclass).
+        return _class_tag(cls)
+
+
+def _class_tag(cls: type) -> str | None:
+    if cls is bool:
+        return "bool"
+    if cls is NoneType:
+        return "none"
+    if issubclass(cls, Enum):
+        return "enum_cls"
+    if issubclass(cls, datetime):
+        return "datetime"
+    if issubclass(cls, str):
+        return "str"
+    if issubclass(cls, int):
+        return "int"
+    if issubclass(cls, BaseModel):
+        return "model"
+    return None
+
+
+def field_data_list(
     annotation: Any,
     key: str,
     value: Any,
     default: Any,
     annotation_iterators: Collection[AnnotationIterator],
     metadata: ta.TickAnnotations,
-) -> Iterable[FieldData]:
-    if isinstance(annotation, FieldData):
-        yield annotation
-
-    else:
-        found = False
-        for annotation_iterator in annotation_iterators:
-            for _annotation, meta in annotation_iterator(
-                annotation, key, value, default, metadata=metadata
-            ):
-                found = True
-                yield from _iter_over_annotation(
-                    _annotation, key, value, default, annotation_iterators, meta
+) -> list[FieldData]:
+    """Walk over an annotation and collect all FieldData objects it results in.
+
+    Args:
+        annotation: The type annotation.
+        key: The key of the (pydantic) field.
+        value: An optional value of the key.
+        default: An optional default value of the key.
+        annotation_iterators: A collection of annotation iterators.
+        metadata: The tick annotations of the annotation. Cached and shared,
+            so it must not be modified.
+
+    Raises:
+        ValueError: When none of the annotation iterators handles (a part of)
+            the annotation.
+
+    Returns:
+        The FieldData objects in order of appearance in the annotation.
+    """
+    field_data: list[FieldData] = []
+    # A depth first walk over the annotation using a stack instead of recursion.
+    # Children are pushed in reverse so they are popped in their original order.
+    stack: list[tuple[Any, ta.TickAnnotations]] = [(annotation, metadata)]
+    while stack:
+        _annotation, _metadata = stack.pop()
+        if isinstance(_annotation, FieldData):
+            field_data.append(_annotation)
+            continue
+
+        candidates: Collection[AnnotationIterator] = annotation_iterators
+        if annotation_iterators is ANNOTATION_ITERATORS:
+            # usually only one of the default iterators can match. Try it first
+            # instead of probing them one by one. When it yields nothing (an
+            # empty `str` Enum for example) the others are probed in order.
+            tag = _classify(_annotation, _metadata)
+            if tag is not None:
+                candidates = _DISPATCH_CANDIDATES[tag]
+
+        for annotation_iterator in candidates:
+            children = list(
+                annotation_iterator(
+                    _annotation, key, value, default, metadata=_metadata
                 )
-            if found:
+            )
+            if children:
+                stack.extend(reversed(children))
                 break
         else:
-            raise ValueError(f"No FieldDataType found for {annotation}")
+            raise ValueError(f"No FieldDataType found for {_annotation}")
+
+    return field_data
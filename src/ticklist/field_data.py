@@ -5,10 +5,11 @@ Objects representing individual field annotations.
 
 from __future__ import annotations
 
+import operator
 from abc import ABCMeta, abstractmethod
 from collections.abc import Callable
 from enum import Enum
-from typing import Any, Self
+from typing import Any, ClassVar, Self
 
 from pydantic import BaseModel
 from typing_extensions import override
@@ -28,10 +29,10 @@ from ticklist.types import NO_VALUE
 class FieldData(metaclass=ABCMeta):
     """A base field data object."""
 
-    @property
-    @abstractmethod
-    def field_widget(self) -> type[FieldWidget]:
-        """Associated FieldWidget."""
+    __slots__ = ("model", "key", "value", "active", "label")
+
+    field_widget: ClassVar[type[FieldWidget]]
+    """Associated FieldWidget."""
 
     def __init__(
         self,
@@ -160,26 +161,27 @@ class FieldData(metaclass=ABCMeta):
         NO_VALUE  no-match |   NO_VALUE  false
 
         """
-        _value = NO_VALUE
-        _active = False
-        if check(default, annotation):
-            _value = default
-            if value is NO_VALUE:
-                _active = True
+        no_value = NO_VALUE
+        if value is no_value:
+            if check(default, annotation):
+                return default, True
+            return no_value, False
+
+        # a matching value wins. The default is only checked when it does not.
         if check(value, annotation):
-            _value = value
-            _active = True
+            return value, True
+        if check(default, annotation):
+            return default, False
+        return no_value, False
 
-        return _value, _active
 
+class FieldDataForPrimitive(FieldData):
+    """Base field data for a manually entered primitive value.
 
-class FieldDataForString(FieldData):
-    """Field data for a string type."""
+    Subclasses only differ in their associated widget.
+    """
 
-    @property
-    def field_widget(self) -> type[FieldWidget]:
-        """Associated FieldWidget."""
-        return FieldWidgetForString
+    __slots__ = ()
 
     @override
     @classmethod
@@ -191,10 +193,7 @@ class FieldDataForString(FieldData):
         default: Any,
         metadata: ta.TickAnnotations,
     ) -> Self:
-        def _check(value: Any, annotation: Any) -> bool:
-            return isinstance(value, annotation)
-
-        _value, _active = cls._evaluate_values(annotation, default, value, _check)
+        _value, _active = cls._evaluate_values(annotation, default, value, isinstance)
 
         return cls(
             annotation=annotation,
@@ -205,9 +204,19 @@ class FieldDataForString(FieldData):
         )
 
 
+class FieldDataForString(FieldDataForPrimitive):
+    """Field data for a string type."""
+
+    __slots__ = ()
+
+    field_widget = FieldWidgetForString
+
+
 class FieldDataForMultilineString(FieldData):
     """Field data for a multiline string type."""
 
+    __slots__ = ("height",)
+
     def __init__(
         self,
         annotation: Any,
@@ -221,10 +230,7 @@ class FieldDataForMultilineString(FieldData):
         super().__init__(annotation, key, value, active, label)
         self.height = height
 
-    @property
-    def field_widget(self) -> type[FieldWidget]:
-        """Associated FieldWidget."""
-        return FieldWidgetForMultilineString
+    field_widget = FieldWidgetForMultilineString
 
     @override
     @classmethod
@@ -236,10 +242,7 @@ class FieldDataForMultilineString(FieldData):
         default: Any,
         metadata: ta.TickAnnotations,
     ) -> Self:
-        def _check(value: Any, annotation: Any) -> bool:
-            return isinstance(value, annotation)
-
-        _value, _active = cls._evaluate_values(annotation, default, value, _check)
+        _value, _active = cls._evaluate_values(annotation, default, value, isinstance)
 
         return cls(
             annotation=annotation,
@@ -251,68 +254,20 @@ class FieldDataForMultilineString(FieldData):
         )
 
 
-class FieldDataForInt(FieldData):
+class FieldDataForInt(FieldDataForPrimitive):
     """Field data for an int type."""
 
-    @property
-    def field_widget(self) -> type[FieldWidget]:
-        """Associated FieldWidget."""
-        return FieldWidgetForInt
-
-    @override
-    @classmethod
-    def parse(
-        cls,
-        annotation: Any,
-        key: str,
-        value: Any,
-        default: Any,
-        metadata: ta.TickAnnotations,
-    ) -> Self:
-        def _check(value: Any, annotation: Any) -> bool:
-            return isinstance(value, annotation)
+    __slots__ = ()
 
-        _value, _active = cls._evaluate_values(annotation, default, value, _check)
-
-        return cls(
-            annotation=annotation,
-            key=key,
-            value=_value,
-            active=_active,
-            label="manual input",
-        )
+    field_widget = FieldWidgetForInt
 
 
-class FieldDataForDatetime(FieldData):
+class FieldDataForDatetime(FieldDataForPrimitive):
     """Field data for a datetime type."""
 
-    @property
-    def field_widget(self) -> type[FieldWidget]:
-        """Associated FieldWidget."""
-        return FieldWidgetForString
-
-    @override
-    @classmethod
-    def parse(
-        cls,
-        annotation: Any,
-        key: str,
-        value: Any,
-        default: Any,
-        metadata: ta.TickAnnotations,
-    ) -> Self:
-        def _check(value: Any, annotation: Any) -> bool:
-            return isinstance(value, annotation)
-
-        _value, _active = cls._evaluate_values(annotation, default, value, _check)
+    __slots__ = ()
 
-        return cls(
-            annotation=annotation,
-            key=key,
-            value=_value,
-            active=_active,
-            label="manual input",
-        )
+    field_widget = FieldWidgetForString
 
 
 class FieldDataForEnumValue(FieldData):
@@ -322,10 +277,9 @@ class FieldDataForEnumValue(FieldData):
     This is one item from a defined enum.
     """
 
-    @property
-    def field_widget(self) -> type[FieldWidget]:
-        """Associated FieldWidget."""
-        return FieldWidgetForFixedValue
+    __slots__ = ()
+
+    field_widget = FieldWidgetForFixedValue
 
     @override
     @classmethod
@@ -337,12 +291,7 @@ class FieldDataForEnumValue(FieldData):
         default: Any,
         metadata: ta.TickAnnotations,
     ) -> Self:
-        def check(value: Any, annotation: Any) -> bool:
-            if value == annotation:
-                return True
-            return False
-
-        _, _active = cls._evaluate_values(annotation, default, value, check)
+        _, _active = cls._evaluate_values(annotation, default, value, operator.eq)
         return cls(
             annotation=annotation,
             key=key,
@@ -359,10 +308,9 @@ class FieldDataForLiteralValue(FieldData):
     This is one item from a defined Literal type.
     """
 
-    @property
-    def field_widget(self) -> type[FieldWidget]:
-        """Associated FieldWidget."""
-        return FieldWidgetForFixedValue
+    __slots__ = ()
+
+    field_widget = FieldWidgetForFixedValue
 
     @override
     @classmethod
@@ -374,12 +322,7 @@ class FieldDataForLiteralValue(FieldData):
         default: Any,
         metadata: ta.TickAnnotations,
     ) -> Self:
-        def check(value: Any, annotation: Any) -> bool:
-            if value == annotation:
-                return True
-            return False
-
-        _, _active = cls._evaluate_values(annotation, default, value, check)
+        _, _active = cls._evaluate_values(annotation, default, value, operator.eq)
         return cls(
             annotation=annotation,
             key=key,
@@ -392,10 +335,9 @@ class FieldDataForLiteralValue(FieldData):
 class FieldDataForNoneValue(FieldData):
     """Field data for none value."""
 
-    @property
-    def field_widget(self) -> type[FieldWidget]:
-        """Associated FieldWidget."""
-        return FieldWidgetForFixedValue
+    __slots__ = ()
+
+    field_widget = FieldWidgetForFixedValue
 
     @override
     @classmethod
@@ -407,12 +349,7 @@ class FieldDataForNoneValue(FieldData):
         default: Any,
         metadata: ta.TickAnnotations,
     ) -> Self:
-        def check(value: Any, annotation: Any) -> bool:
-            if value is annotation:
-                return True
-            return False
-
-        _, _active = cls._evaluate_values(annotation, default, value, check)
+        _, _active = cls._evaluate_values(annotation, default, value, operator.is_)
         return cls(
             annotation=annotation,
             key=key,
@@ -425,10 +362,9 @@ class FieldDataForNoneValue(FieldData):
 class FieldDataForBooleanValue(FieldData):
     """Field data for a boolean value."""
 
-    @property
-    def field_widget(self) -> type[FieldWidget]:
-        """Associated FieldWidget."""
-        return FieldWidgetForFixedValue
+    __slots__ = ()
+
+    field_widget = FieldWidgetForFixedValue
 
     @override
     @classmethod
@@ -440,12 +376,7 @@ class FieldDataForBooleanValue(FieldData):
         default: Any,
         metadata: ta.TickAnnotations,
     ) -> Self:
-        def check(value: Any, annotation: Any) -> bool:
-            if value is annotation:
-                return True
-            return False
-
-        _, _active = cls._evaluate_values(annotation, default, value, check)
+        _, _active = cls._evaluate_values(annotation, default, value, operator.is_)
 
         if boolean_label := metadata.get("boolean_labels", None):
             if annotation:
@@ -467,10 +398,9 @@ class FieldDataForBooleanValue(FieldData):
 class FieldDataForModel(FieldData):
     """Field data for a pydantic model."""
 
-    @property
-    def field_widget(self) -> type[FieldWidget]:
-        """Associated FieldWidget."""
-        return FieldWidgetForModel
+    __slots__ = ()
+
+    field_widget = FieldWidgetForModel
 
     @override
     @classmethod
@@ -482,13 +412,12 @@ class FieldDataForModel(FieldData):
         default: Any,
         metadata: ta.TickAnnotations,
     ) -> Self:
-        def _check(value: Any, annotation: type[BaseModel]) -> bool:
-            return isinstance(value, annotation)
-
         if label_data := metadata.get("label"):
             label = label_data.value
         else:
             label = "define"
 
-        _value, _active = cls._evaluate_values(annotation, default, value, check=_check)
+        _value, _active = cls._evaluate_values(
+            annotation, default, value, check=isinstance
+        )
         return cls(annotation, key=key, value=_value, active=_active, label=label)
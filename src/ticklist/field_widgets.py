@@ -46,6 +46,8 @@ class FieldWidget(Static, can_focus=False):
     class ValueChanged(Message):
         """A value has changed."""
 
+        __slots__ = ("key", "value")
+
         def __init__(self, key: str, value: Any) -> None:
             """Init.
 
@@ -70,7 +72,11 @@ class FieldWidget(Static, can_focus=False):
         self._label = field_data.label
         # super needs to become before the setting of a reactive value.
         super().__init__(classes="field_widget")
-        self.value = field_data.value
+        self.set_reactive(FieldWidget.value, field_data.value)
+        if field_data.active and field_data.value is not NO_VALUE:
+            # Only an active widget with a value contributes to the form
+            # initially. Skip the watcher to not post a message for all others.
+            self.post_message(FieldWidget.ValueChanged(self._key, field_data.value))
 
     @override
     def compose(self) -> ComposeResult:
@@ -163,11 +169,6 @@ class FieldWidgetForFixedValue(FieldWidget):
     of OptionContainers.
     """
 
-    @override
-    def __init__(self, field_data: FieldData) -> None:
-        with self.prevent(FieldWidget.ValueChanged):
-            super().__init__(field_data)
-
     @override
     def get_content_height(self, container: Size, viewport: Size, width: int) -> int:
         return 1
@@ -179,6 +180,8 @@ class FieldWidgetForModel(FieldWidget):
     class EditModel(Message):
         """Model encountered message."""
 
+        __slots__ = ("model", "value", "widget")
+
         def __init__(
             self, model: type[BaseModel], value: BaseModel, widget: FieldWidget
         ) -> None:
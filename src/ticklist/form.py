@@ -34,10 +34,11 @@ This model results in the following form:
 ```
 """
 
-from typing import Any, Collection, Sequence, Type, TypeVar
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Collection, Sequence, Type, TypeVar
 
 from pydantic import BaseModel, ValidationError
-from pydantic_core import ErrorDetails
 from textual import on
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal
@@ -46,12 +47,14 @@ from textual.geometry import Size
 from textual.message import Message
 from textual.reactive import reactive
 from textual.screen import Screen
-from textual.widgets import Button, Label, Pretty, Static
+from textual.widgets import Button, Label, Static
 from typing_extensions import override
 
 from ticklist.annotation_iterators import (
     ANNOTATION_ITERATORS,
+    ModelPlan,
     field_data_from_annotation,
+    plan_for_model,
 )
 from ticklist.field_data import (
     FieldData,
@@ -62,6 +65,10 @@ from ticklist.field_widgets import (
 )
 from ticklist.types import NO_VALUE, NOTHING, AnnotationIterator
 
+if TYPE_CHECKING:
+    from pydantic_core import ErrorDetails  # pragma: no cover
+    from textual.timer import Timer  # pragma: no cover
+
 
 class _Option(Static, can_focus=True):
     """A checkbox belonging to a group.
@@ -105,6 +112,9 @@ class _Option(Static, can_focus=True):
     checked: reactive[bool] = reactive(False, init=False)
     """The value of the button. `True` for on, `False` for off."""
 
+    # the rendered checkbox by checked state. The brackets are escaped markup.
+    _GLYPHS = (r"\[ ]", r"\[X]")
+
     def __init__(self, idx: int, checked: bool) -> None:
         """Init.
 
@@ -138,10 +148,7 @@ class _Option(Static, can_focus=True):
 
     def render(self) -> str:
         """Render the checkbox."""
-        if self.checked:
-            return "\[X]"
-        else:
-            return "\[ ]"
+        return self._GLYPHS[self.checked]
 
     @override
     def get_content_height(self, container: Size, viewport: Size, width: int) -> int:
@@ -181,44 +188,55 @@ class _OptionGroup(Static, can_focus=False):
                 Used for composing the widgets.
         """
         self._field_data = field_data
+        # the option and field widget of every row, in order of index.
+        self._option_rows: list[tuple[_Option, FieldWidget]] = []
         super().__init__(classes="option_group")
 
     @override
     def compose(self) -> ComposeResult:
+        self._option_rows = []
         for idx, data in enumerate(self._field_data):
+            _option = _Option(idx, data.active)
+            # yield Label(data.label, classes="field_widget_label")
+            _field_widget = data.field_widget(data)
+            _field_widget.disabled = not data.active
+            self._option_rows.append((_option, _field_widget))
             with Horizontal(classes="option_container"):
-                yield _Option(idx, data.active)
-                # yield Label(data.label, classes="field_widget_label")
-                _field_widget = data.field_widget(data)
-                _field_widget.disabled = not data.active
+                yield _option
                 yield _field_widget
 
     @on(_Option.Changed)
     def _option_checked(self, event: _Option.Changed) -> None:
-        for container in self.query(Horizontal):
-            _option = container.query_one(_Option)
-            _field_widget = container.query_one(FieldWidget)
-
-            if _option.idx == event.idx:
-                # this field widget must be enabled.
-                _field_widget.disabled = False
-                self.post_message(
-                    FieldWidget.ValueChanged(
-                        _field_widget._key, value=_field_widget.value
+        # one repaint for switching all options. Unchecking an option does not
+        # post a message, so only the checked option reports its value.
+        with self.app.batch_update():
+            for _option, _field_widget in self._option_rows:
+                if _option.idx == event.idx:
+                    # this field widget must be enabled.
+                    _field_widget.disabled = False
+                    self.post_message(
+                        FieldWidget.ValueChanged(
+                            _field_widget._key, value=_field_widget.value
+                        )
                     )
-                )
-            else:
-                _option.checked = False
-                _field_widget.disabled = True
+                else:
+                    _option.checked = False
+                    _field_widget.disabled = True
 
 
 ModelType = TypeVar("ModelType", bound=BaseModel)
 
+VALIDATION_DELAY = 0.15
+"""Seconds to wait after the last edit before validating the form."""
+
 
 class Form(Screen[ModelType]):
     """Pydantic form.
 
     Contains widgets for creating and editing pydantic objects.
+
+    Models configured with `defer_build=True` are supported. Their schema
+    is built when the form validates them for the first time.
     """
 
     DEFAULT_CLASSES = "ticklistForm"
@@ -274,14 +292,90 @@ class Form(Screen[ModelType]):
         # is cancelled and you need to return the old values.
         self._old_instance = instance
 
-        self._annotation_iterators = annotation_iterators or ANNOTATION_ITERATORS
+        _iterators = tuple(annotation_iterators or ANNOTATION_ITERATORS)
+        if _iterators == ANNOTATION_ITERATORS:
+            # the default iterators are dispatched on directly instead of being
+            # probed one by one. Reuse them so this also applies to a copy.
+            _iterators = ANNOTATION_ITERATORS
+        self._annotation_iterators = _iterators
         self._model_info = model_info
+        # the field data of all fields. Evaluated once, as (re)composing
+        # only needs to create new widgets from it.
+        self._fields = self._field_data()
+        self._validate_timer: Timer | None = None
+        # the label of every field, by field (key).
+        self._labels_by_key: dict[str, Label] = {}
+        # the validation errors currently shown by the model info output.
+        self._shown_errors: list[ErrorDetails] | None = None
+        # revision of `self.obj`, bumped on every change, and the revision
+        # the current instance (or validation error) was created from.
+        self._obj_rev = 0
+        self._validated_rev = -1
+        # The validator of the model, once its schema has been built.
+        # Calling it directly skips the `BaseModel.__init__` python wrapper.
+        self._validate_python: Callable[[dict[str, Any]], Any] | None = None
         super().__init__()
 
+    def _field_data(self) -> ModelPlan:
+        plan = plan_for_model(self._model, self._annotation_iterators)
+        if self._instance is NO_VALUE:
+            return plan
+
+        # the planned field data has no value. Evaluate again
+        # with the values of the instance.
+        return tuple(
+            (
+                field,
+                field_info,
+                field_data_from_annotation(
+                    annotation=field_info.annotation,
+                    key=field,
+                    value=getattr(self._instance, field),
+                    default=field_info.default,
+                    annotation_iterators=self._annotation_iterators,
+                    metadata=field_info.metadata,
+                ),
+            )
+            for field, field_info, _ in plan
+        )
+
+    def _validate(self) -> ModelType:
+        validate_python = self._validate_python
+        if validate_python is None:
+            if not self._model.__pydantic_complete__ or (
+                # a custom `__init__` must keep being called.
+                self._model.__init__ is not BaseModel.__init__
+            ):
+                # this also builds the schema of a `defer_build` model.
+                return self._model(**self.obj)
+            validate_python = self._model.__pydantic_validator__.validate_python
+            self._validate_python = validate_python
+
+        instance: ModelType = validate_python(self.obj)
+        return instance
+
+    def _instantiate_later(self) -> None:
+        """Instantiate the model once the user has stopped editing for a while.
+
+        Rapid edits (like typing) reschedule the validation instead of
+        validating the whole model on every keystroke.
+        """
+        if self._validate_timer is not None:
+            self._validate_timer.stop()
+        self._validate_timer = self.set_timer(
+            VALIDATION_DELAY, self._instantiate, name="validate"
+        )
+
     def _instantiate(self) -> bool:
+        if self._validate_timer is not None:
+            # validating now. A pending validation is not needed anymore.
+            self._validate_timer.stop()
+            self._validate_timer = None
+
+        self._validated_rev = self._obj_rev
         errors: list[ErrorDetails] = []
         try:
-            self._instance = self._model(**self.obj)
+            self._instance = self._validate()
 
         except ValidationError as err:
             errors = err.errors(
@@ -294,46 +388,34 @@ class Form(Screen[ModelType]):
         return True
 
     def _display_issues(self, errors: list[ErrorDetails]) -> None:
-        if self._model_info:
+        if self._model_info and errors != self._shown_errors:
+            # re-rendering the errors is only needed when they have changed.
+            self._shown_errors = errors
+            from textual.widgets import Pretty
+
             error_output = self.query_one(Pretty)
             error_output.update(errors)
 
-        print("display issues")
-        labels = self.query(".field_label")
-        for label in labels:
-            _key = label.id.split("_", maxsplit=1)[-1]  # type: ignore
-            for error in errors:
-                if _key in error["loc"]:
-                    label.add_class("field_error")
-                    break
-            else:
-                label.remove_class("field_error")
+        error_keys = {part for error in errors for part in error["loc"]}
+        # one repaint for all label changes.
+        with self.app.batch_update():
+            for key, label in self._labels_by_key.items():
+                label.set_class(key in error_keys, "field_error")
 
     @override
     def compose(self) -> ComposeResult:
+        self._labels_by_key = {}
         yield Label(self._model.__name__, classes="title")
         if _doc := self._model.__doc__:
             yield Label(_doc)
-        for field, field_info in self._model.model_fields.items():
-            if self._instance is NO_VALUE:
-                value = NO_VALUE
-            else:
-                value = getattr(self._instance, field)
-
+        for field, field_info, items in self._fields:
             # label showing the pydantic field/key.
-            yield Label(field, classes="field_label", id=f"label_{field}")
+            label = Label(field, classes="field_label", id=f"label_{field}")
+            self._labels_by_key[field] = label
+            yield label
             if field_info.description:
                 yield Label(field_info.description, classes="docstring")
 
-            items = field_data_from_annotation(
-                annotation=field_info.annotation,
-                key=field,
-                value=value,
-                default=field_info.default,
-                annotation_iterators=self._annotation_iterators,
-                metadata=field_info.metadata,
-            )
-
             if len(items) == 1:
                 yield items[0].field_widget(items[0])
             else:
@@ -346,6 +428,8 @@ class Form(Screen[ModelType]):
 
         if self._model_info:
             # used for pydantic validation error output.
+            # Only imported when needed as it is for debugging purposes only.
+            from textual.widgets import Pretty
 
             yield Pretty("")
 
@@ -353,28 +437,47 @@ class Form(Screen[ModelType]):
             yield Button("OK", variant="primary", id="ok")
             yield Button("CANCEL", variant="error", id="cancel")
 
+    def _instantiate_if_changed(self) -> None:
+        if self._validated_rev != self._obj_rev:
+            # only validate again when something has changed since the
+            # last validation.
+            self._instantiate()
+
     def _on_show(self, event: Show) -> None:
-        self._instantiate()
+        # also shown again when returning from a sub form.
+        self._instantiate_if_changed()
 
     @on(FieldWidget.ValueChanged)
     def _field_widget_value_changed(self, event: FieldWidget.ValueChanged) -> None:
         """Run when a field-widget has changed its value."""
         event.stop()
 
-        if event.value is NO_VALUE:
+        # runs on every edit. Bind the sentinel and event attributes to locals.
+        no_value = NO_VALUE
+        key = event.key
+        value = event.value
+
+        current = self.obj.get(key, no_value)
+        if current is value or (type(current) is type(value) and current == value):
+            # nothing has changed. An option group for example re-posts the
+            # value of an option when it is checked.
+            return
+
+        if value is no_value:
             # a field widget has been selected which has no value yet.
             # Further action from the user is required.
             # To prevent and old values to stick around we will
             # delete the key of this value.
-            self.obj.pop(event.key, None)
+            del self.obj[key]
         else:
-            self.obj[event.key] = event.value
+            self.obj[key] = value
+        self._obj_rev += 1
         if self._model_info:
             # this is here for debugging purposes and shows
             # the dict with the latest values.
             lbl = self.query_one("#obj", expect_type=Label)
             lbl.update(str(self.obj))
-        self._instantiate()
+        self._instantiate_later()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Run when button is pressed.
@@ -385,7 +488,7 @@ class Form(Screen[ModelType]):
         On cancel, either the old instance is returned or None.
         """
         event.stop()
-        self._instantiate()
+        self._instantiate_if_changed()
 
         if event.button.id == "cancel":
             self.dismiss()
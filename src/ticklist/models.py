@@ -0,0 +1,38 @@
+"""Pydantic base models."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from pydantic import BaseModel
+
+from ticklist.annotation_iterators import (
+    ANNOTATION_ITERATORS,
+    StringAndLiteralAnnotationNotAllowed,
+    plan_for_model,
+)
+
+
+class FormReadyModel(BaseModel):
+    """A pydantic model which prepares its form data when the class is created.
+
+    Subclasses get their field data evaluated (and memoized) at import, instead
+    of when the first form for them is opened. Models which are not complete
+    yet (because of unresolved forward references) are evaluated on first use.
+
+    Models with fields a form cannot represent (like base models which are
+    never shown in a form) do not fail at import. The error is raised when a
+    form for the model is created instead.
+    """
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Evaluate the field data of the new (and complete) model class."""
+        super().__pydantic_init_subclass__(**kwargs)
+        if cls.__pydantic_complete__:
+            try:
+                plan_for_model(cls, ANNOTATION_ITERATORS)
+            except (ValueError, StringAndLiteralAnnotationNotAllowed):
+                # nothing is cached for a failing plan. Creating a form for
+                # the model evaluates it again and raises the same error.
+                pass
@@ -6,8 +6,9 @@ the associated widget.
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
-from typing import Any, Collection, NotRequired, TypedDict
+from typing import Any, Collection, Literal, NotRequired, TypedDict
 
 
 @dataclass(frozen=True)
@@ -47,15 +48,48 @@ class TickAnnotations(TypedDict):
     multiline: NotRequired[Multiline]
 
 
+_TickAnnotationKey = Literal["label", "boolean_labels", "multiline"]
+
+_TICK_ANNOTATION_KEYS: dict[type, _TickAnnotationKey] = {
+    Label: "label",
+    BooleanLabels: "boolean_labels",
+    Multiline: "multiline",
+}
+_TICK_ANNOTATION_TYPES = tuple(_TICK_ANNOTATION_KEYS)
+
+
+def _subclass_key(anno: Any) -> _TickAnnotationKey | None:
+    if isinstance(anno, _TICK_ANNOTATION_TYPES):
+        for cls in type(anno).__mro__:
+            if cls in _TICK_ANNOTATION_KEYS:
+                return _TICK_ANNOTATION_KEYS[cls]
+    return None
+
+
 def to_tick_annotations(annotations: Collection[Any]) -> TickAnnotations:
-    """Filter out all tick annotations."""
+    """Filter out all tick annotations.
+
+    Results are cached, so the returned dict can be shared between calls
+    and must not be modified.
+    """
+    _annotations = tuple(annotations)
+    try:
+        hash(_annotations)
+    except TypeError:
+        # unhashable annotations.
+        return _tick_annotations(_annotations)
+    return _cached_tick_annotations(_annotations)
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_tick_annotations(annotations: tuple[Any, ...]) -> TickAnnotations:
+    return _tick_annotations(annotations)
+
+
+def _tick_annotations(annotations: Collection[Any]) -> TickAnnotations:
     tick_annotations: TickAnnotations = {}
     for anno in annotations:
-        match anno:
-            case Label():
-                tick_annotations["label"] = anno
-            case BooleanLabels():
-                tick_annotations["boolean_labels"] = anno
-            case Multiline():
-                tick_annotations["multiline"] = anno
+        key = _TICK_ANNOTATION_KEYS.get(type(anno)) or _subclass_key(anno)
+        if key is not None:
+            tick_annotations[key] = anno
     return tick_annotations
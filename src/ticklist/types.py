@@ -42,6 +42,8 @@ class AnnotationIterator(Protocol):
             value: The optional value of the key.
             default: The optional default value of the key.
             metadata: Any information provided with the `Annotated` type annotation.
+                The mapping can be shared with other fields and forms. Do not
+                modify it; yield a new one (`metadata | {...}`) instead.
 
         Returns:
             Either a FieldData object, more annotations to be evaluated
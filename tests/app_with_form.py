@@ -30,11 +30,10 @@ class MyApp(App):
         super().__init__()
 
     def on_mount(self):
-        self.push_screen(
-            form.Form(
-                self._model_type,
-                self._value,
-                self._annotation_iterators,
-                model_info=self._with_model_info,
-            )
+        self.current_form = form.Form(
+            self._model_type,
+            self._value,
+            self._annotation_iterators,
+            model_info=self._with_model_info,
         )
+        self.push_screen(self.current_form)
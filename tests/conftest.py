@@ -1,5 +1,20 @@
 from typing import Collection
 
+import pytest
+
+from tests.app_with_form import MyApp
+
+
+@pytest.fixture
+def app(request) -> MyApp:
+    """An app with a form, created when the test runs.
+
+    Use with indirect parametrization. The parameter is a tuple of
+    the model and an optional instance of that model.
+    """
+    model, value = request.param
+    return MyApp(model, value)
+
 
 def compare(result: object, expected: object):
     """Compare two objects for equality.
@@ -12,7 +27,16 @@ def compare(result: object, expected: object):
     """
     assert type(result) is type(expected)
 
-    assert result.__dict__ == expected.__dict__
+    assert _attributes(result) == _attributes(expected)
+
+
+def _attributes(obj: object) -> dict[str, object]:
+    """Return the instance attributes of a (slotted) object."""
+    attributes = dict(getattr(obj, "__dict__", {}))
+    for cls in type(obj).__mro__:
+        for slot in cls.__dict__.get("__slots__", ()):
+            attributes[slot] = getattr(obj, slot)
+    return attributes
 
 
 def compare_items(items: Collection, *objects):
@@ -1,7 +1,9 @@
+import gc
+import weakref
 from datetime import datetime
 from enum import Enum
 from types import NoneType
-from typing import Annotated, Literal
+from typing import Annotated, Literal, Optional
 
 import pytest
 from pydantic import BaseModel
@@ -11,8 +13,10 @@ from ticklist import tick_annotations as ta
 from ticklist.annotation_iterators import (
     ANNOTATION_ITERATORS,
     StringAndLiteralAnnotationNotAllowed,
+    _classify_class,
     annotated_iterator,
     field_data_from_annotation,
+    plan_for_model,
 )
 from ticklist.field_data import (
     FieldData,
@@ -41,58 +45,177 @@ def test_find_match_fail():
         )  # type: ignore
 
 
+@pytest.mark.parametrize("annotation", [object, object()])
+def test_find_match_fail_default_iterators(annotation):
+    with pytest.raises(ValueError):
+        field_data_from_annotation(
+            annotation=annotation,
+            key="my_key",
+            value=NO_VALUE,
+            default=NO_VALUE,
+            annotation_iterators=ANNOTATION_ITERATORS,
+            metadata=[],
+        )
+
+
+class _DispatchEnum(Enum):
+    one = "one"
+    two = "two"
+
+
+class _DispatchStr(str):
+    pass
+
+
+class _DispatchInt(int):
+    pass
+
+
+class _DispatchEmptyStrEnum(str, Enum):
+    pass
+
+
+class _UnhashableMeta(type):
+    __hash__ = None
+
+
+class _DispatchUnhashableInt(int, metaclass=_UnhashableMeta):
+    pass
+
+
+class _DispatchModel(BaseModel):
+    my_value: str
+
+
 @pytest.mark.parametrize(
-    "default,value,expected",
+    "annotation,metadata",
     [
-        ("default_match", "value_match", ("value_match", True)),
-        ("default_match", NO_VALUE, ("default_match", True)),
-        # the matcher has a value of default,
-        # but is not active as the current pydantic field
-        # has a value which does not match this specific match object.
-        ("default_match", 100, ("default_match", False)),
-        (100, "value_match", ("value_match", True)),
-        (100, NO_VALUE, (NO_VALUE, False)),
-        (100, 100, (NO_VALUE, False)),
-        (NO_VALUE, "value_match", ("value_match", True)),
-        (NO_VALUE, NO_VALUE, (NO_VALUE, False)),
-        (NO_VALUE, 100, (NO_VALUE, False)),
+        (bool, []),
+        (str | None, []),
+        (Optional[str], []),
+        (_DispatchEnum, []),
+        (datetime, []),
+        (str, []),
+        (str, [ta.Multiline()]),
+        (int, []),
+        (_DispatchStr, []),
+        (_DispatchStr, [ta.Multiline()]),
+        (_DispatchInt, []),
+        (_DispatchUnhashableInt, []),
+        (_DispatchModel, []),
+        (_DispatchEmptyStrEnum, []),
+        (Literal["A", "B"] | int, []),
+        (Annotated[bool, ta.BooleanLabels("YES", "NO")] | _DispatchEnum, []),
+        (Annotated[str, ta.Label("unhashable"), ["metadata"]], []),
     ],
 )
-def test_evaluate_values(default, value, expected):
-    """Checking output according to table as provided in the docstring."""
+def test_dispatch_equals_linear_scan(annotation, metadata):
+    """Default iterators give the same result as probing them one by one."""
 
-    def str_check(value, annotation) -> bool:
-        return isinstance(value, annotation)
+    def _field_data(annotation_iterators):
+        return field_data_from_annotation(
+            annotation=annotation,
+            key="my_key",
+            value=NO_VALUE,
+            default=NO_VALUE,
+            annotation_iterators=annotation_iterators,
+            metadata=metadata,
+        )
 
+    compare_items(
+        _field_data(ANNOTATION_ITERATORS), *_field_data(list(ANNOTATION_ITERATORS))
+    )
+
+
+@pytest.mark.parametrize(
+    "annotation_iterators", [ANNOTATION_ITERATORS, list(ANNOTATION_ITERATORS)]
+)
+def test_debug_logging(caplog, annotation_iterators):
+    """Annotation nodes are only logged when debug logging is enabled."""
+    annotation = bool | _DispatchEnum | datetime | int | _DispatchModel | Literal["A"]
+
+    def _field_data(annotation, metadata):
+        return field_data_from_annotation(
+            annotation=annotation,
+            key="my_key",
+            value=None,
+            default=NO_VALUE,
+            annotation_iterators=annotation_iterators,
+            metadata=metadata,
+        )
+
+    _field_data(annotation, [])
+    assert caplog.records == []
+
+    caplog.set_level("DEBUG", logger="ticklist.annotation_iterators")
+    _field_data(annotation, [])
+    _field_data(str, [])
+    _field_data(str, [ta.Multiline()])
+
+    messages = {record.message.split(" ", 2)[1] for record in caplog.records}
+    assert messages == {
+        "Bool",
+        "Enum",
+        "datetime",
+        "str",
+        "Multiline",
+        "Int",
+        "Union",
+        "Basemodel",
+        "Literal",
+    }
+
+
+EVALUATE_VALUES_CASES = (
+    # default, value, expected
+    ("default_match", "value_match", ("value_match", True)),
+    ("default_match", NO_VALUE, ("default_match", True)),
+    # the matcher has a value of default,
+    # but is not active as the current pydantic field
+    # has a value which does not match this specific match object.
+    ("default_match", 100, ("default_match", False)),
+    (100, "value_match", ("value_match", True)),
+    (100, NO_VALUE, (NO_VALUE, False)),
+    (100, 100, (NO_VALUE, False)),
+    (NO_VALUE, "value_match", ("value_match", True)),
+    (NO_VALUE, NO_VALUE, (NO_VALUE, False)),
+    (NO_VALUE, 100, (NO_VALUE, False)),
+)
+
+
+@pytest.mark.parametrize("default,value,expected", EVALUATE_VALUES_CASES)
+def test_evaluate_values(default, value, expected):
+    """Checking output according to table as provided in the docstring."""
     result = FieldData._evaluate_values(
-        annotation=str, default=default, value=value, check=str_check
+        annotation=str, default=default, value=value, check=isinstance
     )
 
     assert result == expected
 
 
-def test_field_data_for_string():
-    class MyStringModel(BaseModel):
-        my_string: str = "abc"
+class _StringModel(BaseModel):
+    my_string: str = "abc"
+
+
+_STRING_FIELD_INFO = _StringModel.model_fields["my_string"]
+
 
+def test_field_data_for_string():
     key = "my_string"
-    field_info = MyStringModel.model_fields[key]
 
-    items = list(
-        field_data_from_annotation(
-            annotation=field_info.annotation,
-            key=key,
-            value=NO_VALUE,
-            default=field_info.default,
-            annotation_iterators=ANNOTATION_ITERATORS,
-            metadata={},
-        )
+    items = field_data_from_annotation(
+        annotation=_STRING_FIELD_INFO.annotation,
+        key=key,
+        value=NO_VALUE,
+        default=_STRING_FIELD_INFO.default,
+        annotation_iterators=ANNOTATION_ITERATORS,
+        metadata={},
     )
 
     compare_items(
         items,
         FieldDataForString(
-            annotation=field_info.annotation,
+            annotation=_STRING_FIELD_INFO.annotation,
             key=key,
             value="abc",
             active=True,
@@ -101,27 +224,28 @@ def test_field_data_for_string():
     )
 
 
-def test_field_data_for_multiline_string():
-    class MyStringModel(BaseModel):
-        multi_line: Annotated[str, ta.Multiline(3)] = "def"
+class _MultilineStringModel(BaseModel):
+    multi_line: Annotated[str, ta.Multiline(3)] = "def"
+
+
+_MULTILINE_STRING_FIELD_INFO = _MultilineStringModel.model_fields["multi_line"]
 
+
+def test_field_data_for_multiline_string():
     key = "multi_line"
-    field_info = MyStringModel().model_fields[key]
 
-    items = list(
-        field_data_from_annotation(
-            annotation=field_info.annotation,
-            key=key,
-            value=NO_VALUE,
-            default=field_info.default,
-            annotation_iterators=ANNOTATION_ITERATORS,
-            metadata=field_info.metadata,
-        )
+    items = field_data_from_annotation(
+        annotation=_MULTILINE_STRING_FIELD_INFO.annotation,
+        key=key,
+        value=NO_VALUE,
+        default=_MULTILINE_STRING_FIELD_INFO.default,
+        annotation_iterators=ANNOTATION_ITERATORS,
+        metadata=_MULTILINE_STRING_FIELD_INFO.metadata,
     )
     compare_items(
         items,
         FieldDataForMultilineString(
-            annotation=field_info.annotation,
+            annotation=_MULTILINE_STRING_FIELD_INFO.annotation,
             key=key,
             value="def",
             active=True,
@@ -131,22 +255,23 @@ def test_field_data_for_multiline_string():
     )
 
 
-def test_field_data_for_optional_string():
-    class MyOptionalString(BaseModel):
-        optional_string: str | None = None
+class _OptionalStringModel(BaseModel):
+    optional_string: str | None = None
+
+
+_OPTIONAL_STRING_FIELD_INFO = _OptionalStringModel.model_fields["optional_string"]
+
 
+def test_field_data_for_optional_string():
     key = "optional_string"
-    field_info = MyOptionalString.model_fields[key]
 
-    items = list(
-        field_data_from_annotation(
-            annotation=field_info.annotation,
-            key=key,
-            value=NO_VALUE,
-            default=field_info.default,
-            annotation_iterators=ANNOTATION_ITERATORS,
-            metadata={},
-        )
+    items = field_data_from_annotation(
+        annotation=_OPTIONAL_STRING_FIELD_INFO.annotation,
+        key=key,
+        value=NO_VALUE,
+        default=_OPTIONAL_STRING_FIELD_INFO.default,
+        annotation_iterators=ANNOTATION_ITERATORS,
+        metadata={},
     )
 
     compare_items(
@@ -168,28 +293,29 @@ def test_field_data_for_optional_string():
     )
 
 
-def test_field_data_for_int():
-    class MyModel(BaseModel):
-        my_int: int = 10
+class _IntModel(BaseModel):
+    my_int: int = 10
+
 
+_INT_FIELD_INFO = _IntModel.model_fields["my_int"]
+
+
+def test_field_data_for_int():
     key = "my_int"
-    field_info = MyModel.model_fields[key]
 
-    items = list(
-        field_data_from_annotation(
-            annotation=field_info.annotation,
-            key=key,
-            value=NO_VALUE,
-            default=field_info.default,
-            annotation_iterators=ANNOTATION_ITERATORS,
-            metadata={},
-        )
+    items = field_data_from_annotation(
+        annotation=_INT_FIELD_INFO.annotation,
+        key=key,
+        value=NO_VALUE,
+        default=_INT_FIELD_INFO.default,
+        annotation_iterators=ANNOTATION_ITERATORS,
+        metadata={},
     )
 
     compare_items(
         items,
         FieldDataForInt(
-            annotation=field_info.annotation,
+            annotation=_INT_FIELD_INFO.annotation,
             key=key,
             value=10,
             active=True,
@@ -198,28 +324,28 @@ def test_field_data_for_int():
     )
 
 
-def test_field_data_for_datetime():
-    class MyModel(BaseModel):
-        my_dt: datetime = datetime(2000, 1, 1)
+class _DatetimeModel(BaseModel):
+    my_dt: datetime = datetime(2000, 1, 1)
 
-    key = "my_dt"
 
-    field_info = MyModel.model_fields[key]
+_DATETIME_FIELD_INFO = _DatetimeModel.model_fields["my_dt"]
 
-    items = list(
-        field_data_from_annotation(
-            annotation=field_info.annotation,
-            key=key,
-            value=NO_VALUE,
-            default=field_info.default,
-            annotation_iterators=ANNOTATION_ITERATORS,
-            metadata={},
-        )
+
+def test_field_data_for_datetime():
+    key = "my_dt"
+
+    items = field_data_from_annotation(
+        annotation=_DATETIME_FIELD_INFO.annotation,
+        key=key,
+        value=NO_VALUE,
+        default=_DATETIME_FIELD_INFO.default,
+        annotation_iterators=ANNOTATION_ITERATORS,
+        metadata={},
     )
     compare_items(
         items,
         FieldDataForDatetime(
-            annotation=field_info.annotation,
+            annotation=_DATETIME_FIELD_INFO.annotation,
             key=key,
             value=datetime(2000, 1, 1),
             active=True,
@@ -228,55 +354,56 @@ def test_field_data_for_datetime():
     )
 
 
-def test_field_data_for_enum():
-    class MyEnum(Enum):
-        one = "one"
-        two = "two"
+class _MyEnum(Enum):
+    one = "one"
+    two = "two"
+
 
-    class EnumModel(BaseModel):
-        choice: MyEnum = MyEnum.two
+class _EnumModel(BaseModel):
+    choice: _MyEnum = _MyEnum.two
 
+
+_ENUM_FIELD_INFO = _EnumModel.model_fields["choice"]
+
+
+def test_field_data_for_enum():
     field = "choice"
-    field_info = EnumModel.model_fields[field]
 
-    items = list(
-        field_data_from_annotation(
-            annotation=field_info.annotation,
-            key=field,
-            value=NO_VALUE,
-            default=field_info.default,
-            annotation_iterators=ANNOTATION_ITERATORS,
-            metadata={},
-        )
+    items = field_data_from_annotation(
+        annotation=_ENUM_FIELD_INFO.annotation,
+        key=field,
+        value=NO_VALUE,
+        default=_ENUM_FIELD_INFO.default,
+        annotation_iterators=ANNOTATION_ITERATORS,
+        metadata={},
     )
 
     compare_items(
         items,
         FieldDataForEnumValue(
-            MyEnum.one, "choice", MyEnum.one, active=False, label="one"
+            _MyEnum.one, "choice", _MyEnum.one, active=False, label="one"
         ),
         FieldDataForEnumValue(
-            MyEnum.two, "choice", MyEnum.two, active=True, label="two"
+            _MyEnum.two, "choice", _MyEnum.two, active=True, label="two"
         ),
     )
 
 
-def test_field_data_for_new_style_union():
-    class MyEnum(Enum):
-        one = "one"
-        two = "two"
+class _EnumOrStringModel(BaseModel):
+    my_value: _MyEnum | str
+
+
+_ENUM_OR_STRING_FIELD_INFO = _EnumOrStringModel.model_fields["my_value"]
 
-    class MyEnumOrString(BaseModel):
-        my_value: MyEnum | str
 
+def test_field_data_for_new_style_union():
     key = "my_value"
-    field_info = MyEnumOrString.model_fields[key]
 
     items = field_data_from_annotation(
-        annotation=field_info.annotation,
+        annotation=_ENUM_OR_STRING_FIELD_INFO.annotation,
         key=key,
         value=NO_VALUE,
-        default=field_info.default,
+        default=_ENUM_OR_STRING_FIELD_INFO.default,
         annotation_iterators=ANNOTATION_ITERATORS,
         metadata={},
     )
@@ -284,10 +411,10 @@ def test_field_data_for_new_style_union():
     compare_items(
         items,
         FieldDataForEnumValue(
-            MyEnum.one, key=key, value=MyEnum.one, active=False, label="one"
+            _MyEnum.one, key=key, value=_MyEnum.one, active=False, label="one"
         ),
         FieldDataForEnumValue(
-            MyEnum.two, key=key, value=MyEnum.two, active=False, label="two"
+            _MyEnum.two, key=key, value=_MyEnum.two, active=False, label="two"
         ),
         FieldDataForString(
             annotation=str, key=key, value=NO_VALUE, active=False, label="manual input"
@@ -295,22 +422,28 @@ def test_field_data_for_new_style_union():
     )
 
 
-def test_field_data_for_old_style_union():
-    class MyEnum(Enum):
-        A = "A"
-        B = "B"
+class _ABEnum(Enum):
+    A = "A"
+    B = "B"
+
+
+class _EnumOrStringWithDefaultModel(BaseModel):
+    my_value: _ABEnum | str = _ABEnum.B
 
-    class MyEnumOrString(BaseModel):
-        my_value: MyEnum | str = MyEnum.B
 
+_ENUM_OR_STRING_DEFAULT_FIELD_INFO = _EnumOrStringWithDefaultModel.model_fields[
+    "my_value"
+]
+
+
+def test_field_data_for_old_style_union():
     key = "my_value"
-    field_info = MyEnumOrString.model_fields[key]
 
     items = field_data_from_annotation(
-        annotation=field_info.annotation,
+        annotation=_ENUM_OR_STRING_DEFAULT_FIELD_INFO.annotation,
         key=key,
         value=NO_VALUE,
-        default=field_info.default,
+        default=_ENUM_OR_STRING_DEFAULT_FIELD_INFO.default,
         annotation_iterators=ANNOTATION_ITERATORS,
         metadata={},
     )
@@ -318,10 +451,10 @@ def test_field_data_for_old_style_union():
     compare_items(
         items,
         FieldDataForEnumValue(
-            MyEnum.A, key=key, value=MyEnum.A, active=False, label="A"
+            _ABEnum.A, key=key, value=_ABEnum.A, active=False, label="A"
         ),
         FieldDataForEnumValue(
-            MyEnum.B, key=key, value=MyEnum.B, active=True, label="B"
+            _ABEnum.B, key=key, value=_ABEnum.B, active=True, label="B"
         ),
         FieldDataForString(
             str, key=key, value=NO_VALUE, active=False, label="manual input"
@@ -329,21 +462,25 @@ def test_field_data_for_old_style_union():
     )
 
 
-def test_field_data_for_model():
-    class SubModel(BaseModel):
-        my_value: str
+class _SubModel(BaseModel):
+    my_value: str
+
+
+class _MainModel(BaseModel):
+    my_sub_model: _SubModel
 
-    class MyMainModel(BaseModel):
-        my_sub_model: SubModel
 
+_MAIN_FIELD_INFO = _MainModel.model_fields["my_sub_model"]
+
+
+def test_field_data_for_model():
     key = "my_sub_model"
-    field_info = MyMainModel.model_fields[key]
 
     items = field_data_from_annotation(
-        annotation=field_info.annotation,
+        annotation=_MAIN_FIELD_INFO.annotation,
         key=key,
         value=NO_VALUE,
-        default=field_info.default,
+        default=_MAIN_FIELD_INFO.default,
         annotation_iterators=ANNOTATION_ITERATORS,
         metadata={},
     )
@@ -351,58 +488,66 @@ def test_field_data_for_model():
     compare_items(
         items,
         FieldDataForModel(
-            SubModel, key=key, value=NO_VALUE, active=False, label="define"
+            _SubModel, key=key, value=NO_VALUE, active=False, label="define"
         ),
     )
 
 
-def test_field_data_union_with_models():
-    class SubModel1(BaseModel):
-        my_value: str
+class _SubModel1(BaseModel):
+    my_value: str
 
-    class SubModel2(BaseModel):
-        my_value: str
 
-    class Model(BaseModel):
-        model: (
-            Annotated[SubModel1, ta.Label("submodel 1")]
-            | Annotated[SubModel2, ta.Label("submodel 2")]
-        )
+class _SubModel2(BaseModel):
+    my_value: str
+
+
+class _UnionOfModelsModel(BaseModel):
+    model: (
+        Annotated[_SubModel1, ta.Label("submodel 1")]
+        | Annotated[_SubModel2, ta.Label("submodel 2")]
+    )
+
 
+_UNION_OF_MODELS_FIELD_INFO = _UnionOfModelsModel.model_fields["model"]
+
+
+def test_field_data_union_with_models():
     key = "model"
-    field_info = Model.model_fields[key]
 
     items = field_data_from_annotation(
-        annotation=field_info.annotation,
+        annotation=_UNION_OF_MODELS_FIELD_INFO.annotation,
         key=key,
         value=NO_VALUE,
-        default=field_info.default,
+        default=_UNION_OF_MODELS_FIELD_INFO.default,
         annotation_iterators=ANNOTATION_ITERATORS,
-        metadata=field_info.metadata,
+        metadata=_UNION_OF_MODELS_FIELD_INFO.metadata,
     )
 
     compare_items(
         items,
         FieldDataForModel(
-            SubModel1, key=key, value=NO_VALUE, active=False, label="submodel 1"
+            _SubModel1, key=key, value=NO_VALUE, active=False, label="submodel 1"
         ),
         FieldDataForModel(
-            SubModel2, key=key, value=NO_VALUE, active=False, label="submodel 2"
+            _SubModel2, key=key, value=NO_VALUE, active=False, label="submodel 2"
         ),
     )
 
 
-def test_field_data_for_literal():
-    class Model(BaseModel):
-        value: Literal["A", "B"] = "B"
+class _LiteralModel(BaseModel):
+    value: Literal["A", "B"] = "B"
 
+
+_LITERAL_FIELD_INFO = _LiteralModel.model_fields["value"]
+
+
+def test_field_data_for_literal():
     key = "value"
-    field_info = Model.model_fields[key]
     items = field_data_from_annotation(
-        annotation=field_info.annotation,
+        annotation=_LITERAL_FIELD_INFO.annotation,
         key=key,
         value=NO_VALUE,
-        default=field_info.default,
+        default=_LITERAL_FIELD_INFO.default,
         annotation_iterators=ANNOTATION_ITERATORS,
         metadata=[],
     )
@@ -414,19 +559,22 @@ def test_field_data_for_literal():
     )
 
 
-def test_field_data_for_boolean():
-    class Model(BaseModel):
-        value: bool
+class _BoolModel(BaseModel):
+    value: bool
+
+
+_BOOL_FIELD_INFO = _BoolModel.model_fields["value"]
+
 
+def test_field_data_for_boolean():
     key = "value"
-    field_info = Model.model_fields[key]
     items = field_data_from_annotation(
-        annotation=field_info.annotation,
+        annotation=_BOOL_FIELD_INFO.annotation,
         key=key,
         value=NO_VALUE,
-        default=field_info.default,
+        default=_BOOL_FIELD_INFO.default,
         annotation_iterators=ANNOTATION_ITERATORS,
-        metadata=field_info.metadata,
+        metadata=_BOOL_FIELD_INFO.metadata,
     )
 
     compare_items(
@@ -448,19 +596,22 @@ def test_field_data_for_boolean():
     )
 
 
-def test_field_data_for_boolean_with_label():
-    class Model(BaseModel):
-        value: Annotated[bool, ta.BooleanLabels("YES", "NO")]
+class _BoolWithLabelsModel(BaseModel):
+    value: Annotated[bool, ta.BooleanLabels("YES", "NO")]
+
 
+_BOOL_WITH_LABELS_FIELD_INFO = _BoolWithLabelsModel.model_fields["value"]
+
+
+def test_field_data_for_boolean_with_label():
     key = "value"
-    field_info = Model.model_fields[key]
     items = field_data_from_annotation(
-        annotation=field_info.annotation,
+        annotation=_BOOL_WITH_LABELS_FIELD_INFO.annotation,
         key=key,
         value=NO_VALUE,
-        default=field_info.default,
+        default=_BOOL_WITH_LABELS_FIELD_INFO.default,
         annotation_iterators=ANNOTATION_ITERATORS,
-        metadata=field_info.metadata,
+        metadata=_BOOL_WITH_LABELS_FIELD_INFO.metadata,
     )
 
     compare_items(
@@ -470,24 +621,143 @@ def test_field_data_for_boolean_with_label():
     )
 
 
+class _StrAndLiteralModel(BaseModel):
+    value: Literal["B"] | str
+
+
+_STR_AND_LITERAL_FIELD_INFO = _StrAndLiteralModel.model_fields["value"]
+
+
 def test_disallowed_string_and_literal():
     """Combination of String and Literal is not allowed.
 
     See exception docstring for more info.
     """
 
-    class Model(BaseModel):
-        value: Literal["B"] | str
-
     key = "value"
-    field_info = Model.model_fields[key]
 
     with pytest.raises(StringAndLiteralAnnotationNotAllowed):
         field_data_from_annotation(
-            annotation=field_info.annotation,
+            annotation=_STR_AND_LITERAL_FIELD_INFO.annotation,
+            key=key,
+            value=NO_VALUE,
+            default=_STR_AND_LITERAL_FIELD_INFO.default,
+            annotation_iterators=ANNOTATION_ITERATORS,
+            metadata=_STR_AND_LITERAL_FIELD_INFO.metadata,
+        )
+
+
+class _IntOrBoolModel(BaseModel):
+    value: int | bool = 1
+
+
+_INT_OR_BOOL_FIELD_INFO = _IntOrBoolModel.model_fields["value"]
+
+
+def test_field_data_for_differently_typed_defaults():
+    key = "value"
+
+    def _field_data(default):
+        return field_data_from_annotation(
+            annotation=_INT_OR_BOOL_FIELD_INFO.annotation,
             key=key,
             value=NO_VALUE,
-            default=field_info.default,
+            default=default,
             annotation_iterators=ANNOTATION_ITERATORS,
-            metadata=field_info.metadata,
+            metadata=_INT_OR_BOOL_FIELD_INFO.metadata,
         )
+
+    # equal, but differently typed defaults are not mixed up.
+    assert [item.active for item in _field_data(True)] == [True, True, False]
+    assert [item.active for item in _field_data(1)] == [True, False, False]
+
+
+class _PlanModel(BaseModel):
+    my_string: str = "abc"
+    my_int: int
+
+
+def test_plan_for_model():
+    plan = plan_for_model(_PlanModel, ANNOTATION_ITERATORS)
+
+    assert plan_for_model(_PlanModel, ANNOTATION_ITERATORS) is plan
+    assert [(field, field_info) for field, field_info, _ in plan] == list(
+        _PlanModel.model_fields.items()
+    )
+    compare_items(
+        plan[0][2],
+        FieldDataForString(
+            annotation=str,
+            key="my_string",
+            value="abc",
+            active=True,
+            label="manual input",
+        ),
+    )
+    compare_items(
+        plan[1][2],
+        FieldDataForInt(
+            annotation=int,
+            key="my_int",
+            value=NO_VALUE,
+            active=False,
+            label="manual input",
+        ),
+    )
+
+
+class _LiteralABModel(BaseModel):
+    my_value: Literal["A", "B"]
+
+
+class _LiteralBAModel(BaseModel):
+    my_value: Literal["B", "A"]
+
+
+class _IntOrStrModel(BaseModel):
+    my_value: int | str
+
+
+class _StrOrIntModel(BaseModel):
+    my_value: str | int
+
+
+def test_plan_for_model_keeps_member_order():
+    """Annotations which only differ in member order are not mixed up.
+
+    `Literal["A", "B"] == Literal["B", "A"]` and `int | str == str | int`.
+    """
+
+    def _field_data(model):
+        ((_, _, field_data),) = plan_for_model(model, ANNOTATION_ITERATORS)
+        return [(type(item), item.label) for item in field_data]
+
+    assert _field_data(_LiteralABModel) == [
+        (FieldDataForLiteralValue, "A"),
+        (FieldDataForLiteralValue, "B"),
+    ]
+    assert _field_data(_LiteralBAModel) == [
+        (FieldDataForLiteralValue, "B"),
+        (FieldDataForLiteralValue, "A"),
+    ]
+    assert _field_data(_IntOrStrModel) == [
+        (FieldDataForInt, "manual input"),
+        (FieldDataForString, "manual input"),
+    ]
+    assert _field_data(_StrOrIntModel) == [
+        (FieldDataForString, "manual input"),
+        (FieldDataForInt, "manual input"),
+    ]
+
+
+def test_classify_class_does_not_keep_classes_alive():
+    class MyModel(BaseModel):
+        my_value: str
+
+    assert _classify_class(MyModel) == "model"
+
+    model_ref = weakref.ref(MyModel)
+    del MyModel
+    gc.collect()
+
+    assert model_ref() is None
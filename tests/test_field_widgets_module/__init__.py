@@ -1,9 +1,12 @@
-from uuid import uuid4
+import itertools
 
 from textual.containers import Container
+from textual.widgets import Input
 
 from ticklist.form import _Option
 
+_id_counter = itertools.count()
+
 
 def check_state(option_container: Container, enabled: bool):
     """Check the state of the checkbox and field widget inside the option_container
@@ -17,6 +20,16 @@ def check_state(option_container: Container, enabled: bool):
     assert option.checked is enabled
 
 
+def check_states(app, enabled: tuple[bool, ...]):
+    """Check the state of all option containers of the app in one pass.
+
+    helper function.
+    """
+    option_containers = app.query(".option_container")
+    for option_container, is_enabled in zip(option_containers, enabled, strict=True):
+        check_state(option_container, is_enabled)
+
+
 async def click_option_container(option_container: Container, pilot):
     """Make this option container active by clicking the option checkbox.
 
@@ -24,6 +37,15 @@ async def click_option_container(option_container: Container, pilot):
     """
     option = option_container.query_one(_Option)
     if not option.id:
-        option.id = f"custom_id{uuid4()!s}"
+        option.id = f"custom_id{next(_id_counter)}"
 
     await pilot.click(f"#{option.id}")
+
+
+async def type_text(inp: Input, text: str, pilot):
+    """Insert text at the cursor of an input as a single edit.
+
+    helper function.
+    """
+    inp.insert_text_at_cursor(text)
+    await pilot.pause()
@@ -1,11 +1,14 @@
 from typing import Literal
 
 import pytest
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, PrivateAttr
+from textual.widgets import Input
 
 from tests.app_with_form import MyApp
 from tests.test_field_widgets_module import check_state, click_option_container
-from ticklist.form import Form, _Option
+from ticklist.annotation_iterators import ANNOTATION_ITERATORS, str_type_iterator
+from ticklist.form import VALIDATION_DELAY, Form, _Option
+from ticklist.types import NO_VALUE
 
 
 @pytest.mark.asyncio
@@ -24,7 +27,7 @@ async def test_option_container_double_click(model_info):
     app = MyApp(MyModel, with_model_info=model_info)
 
     async with app.run_test() as pilot:
-        form = app.query_one(Form)
+        form = app.current_form
         option_1, option_2 = app.query(".option_container").nodes
 
         await click_option_container(option_1, pilot)
@@ -48,7 +51,7 @@ async def test_checkbox_by_key(keys):
     app = MyApp(MyModel)
 
     async with app.run_test() as pilot:
-        form = app.query_one(Form)
+        form = app.current_form
         option_1, option_2 = app.query(".option_container").nodes
 
         check_state(option_1, False)
@@ -63,6 +66,140 @@ async def test_checkbox_by_key(keys):
         assert form.obj == {"my_value": "A"}
 
 
+@pytest.mark.asyncio
+async def test_validation_after_edit():
+    """The form is validated once editing has paused."""
+
+    class MyModel(BaseModel):
+        my_value: int
+
+    app = MyApp(MyModel)
+
+    async with app.run_test() as pilot:
+        form = app.current_form
+        label = form.query_one("#label_my_value")
+        await pilot.pause()
+        assert label.has_class("field_error")
+
+        form.query_one(Input).focus()
+        await pilot.press("1", "2")
+        assert form.obj == {"my_value": "12"}
+
+        await pilot.pause(VALIDATION_DELAY * 2)
+        assert not label.has_class("field_error")
+        assert form._instance == MyModel(my_value=12)
+
+
+class _PlainModel(BaseModel):
+    my_value: int = 1
+
+
+class _DeferredModel(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
+    my_value: int = 1
+
+
+class _CustomInitModel(BaseModel):
+    my_value: int = 1
+
+    _initialized: bool = PrivateAttr(False)
+
+    def __init__(self, **data):
+        super().__init__(**data)
+        self._initialized = True
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("model", [_PlainModel, _DeferredModel])
+async def test_validate_with_validator(model):
+    """The model validator is used directly once the schema is built."""
+    app = MyApp(model)
+
+    async with app.run_test():
+        form = app.current_form
+        form._instantiate()
+
+        assert form._validate_python is not None
+        assert form._instance == model(my_value=1)
+
+
+@pytest.mark.asyncio
+async def test_validate_with_custom_init():
+    """A model with its own `__init__` is always instantiated through it."""
+    app = MyApp(_CustomInitModel)
+
+    async with app.run_test():
+        form = app.current_form
+        form._instantiate()
+
+        assert form._validate_python is None
+        assert form._instance._initialized
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("wait", [True, False])
+async def test_ok_after_edit(wait):
+    """OK returns the instance from the latest value, validated only once."""
+
+    class MyModel(BaseModel):
+        my_value: int
+
+    app = MyApp(MyModel)
+
+    async with app.run_test() as pilot:
+        form = app.current_form
+        form.query_one(Input).focus()
+        await pilot.press("1", "2")
+        if wait:
+            await pilot.pause(VALIDATION_DELAY * 2)
+        validated = form._instance
+
+        await pilot.click("#ok")
+
+        assert form._instance == MyModel(my_value=12)
+        assert (form._instance is validated) is wait
+
+
+@pytest.mark.asyncio
+async def test_unchanged_value_is_ignored():
+    """Posting the current value again does not count as a change."""
+
+    class MyModel(BaseModel):
+        my_value: Literal["A", "B"] = "A"
+
+    app = MyApp(MyModel)
+
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        form = app.current_form
+        # both the option widget and its option have posted the value.
+        assert form.obj == {"my_value": "A"}
+        assert form._obj_rev == 1
+
+
+@pytest.mark.parametrize(
+    "annotation_iterators,expected",
+    [
+        (None, ANNOTATION_ITERATORS),
+        (list(ANNOTATION_ITERATORS), ANNOTATION_ITERATORS),
+        ([str_type_iterator], (str_type_iterator,)),
+    ],
+)
+def test_form_annotation_iterators(annotation_iterators, expected):
+    """Annotation iterators are stored as a tuple, reusing the default one."""
+
+    class MyModel(BaseModel):
+        my_value: str
+
+    form = Form(MyModel, NO_VALUE, annotation_iterators)
+
+    assert form._annotation_iterators == expected
+    assert (form._annotation_iterators is ANNOTATION_ITERATORS) is (
+        expected is ANNOTATION_ITERATORS
+    )
+
+
 # @pytest.mark.asyncio
 # async def test_ok_form_incomplete():
 #     class MyModel(BaseModel):
@@ -7,9 +7,6 @@ import pytest
 from pydantic import BaseModel
 from textual.widgets import Input
 
-from tests.app_with_form import MyApp
-from ticklist.form import Form
-
 
 class MyStringModel(BaseModel):
     my_value: str
@@ -31,17 +28,18 @@ class MyIntModelWithDefault(BaseModel):
 @pytest.mark.parametrize(
     "app,result",
     [
-        (MyApp(MyStringModel), {}),
-        (MyApp(MyStringModelWithDefault), {"my_value": "my_default"}),
-        (MyApp(MyIntModel), {}),
-        (MyApp(MyIntModelWithDefault), {"my_value": "999"}),
+        ((MyStringModel, None), {}),
+        ((MyStringModelWithDefault, None), {"my_value": "my_default"}),
+        ((MyIntModel, None), {}),
+        ((MyIntModelWithDefault, None), {"my_value": "999"}),
     ],
+    indirect=["app"],
 )
 async def test_initial_values(app, result):
     """Form object has default model value at startup."""
 
     async with app.run_test():
-        my_form = app.query_one(Form)
+        my_form = app.current_form
 
         assert my_form.obj == result
 
@@ -50,22 +48,23 @@ async def test_initial_values(app, result):
 @pytest.mark.parametrize(
     "app,manual_input",
     [
-        (MyApp(MyStringModel), "custom_string"),
-        (MyApp(MyStringModelWithDefault), "custom_string"),
-        (MyApp(MyIntModel), "12"),
-        (MyApp(MyIntModelWithDefault), "12"),
+        ((MyStringModel, None), "custom_string"),
+        ((MyStringModelWithDefault, None), "custom_string"),
+        ((MyIntModel, None), "12"),
+        ((MyIntModelWithDefault, None), "12"),
     ],
+    indirect=["app"],
 )
 async def test_manual_input(app, manual_input):
     """User entry in input ends up in form object."""
 
     async with app.run_test() as pilot:
-        my_form = app.query_one(Form)
+        my_form = app.current_form
         my_inp = app.query_one(Input)
 
-        my_inp.clear()
         my_inp.focus()
-        # simulate manual key presses.
-        await pilot.press(*list(manual_input))
+        # setting the value posts a single Input.Changed message.
+        my_inp.value = manual_input
+        await pilot.pause()
 
         assert my_form.obj == {"my_value": manual_input}
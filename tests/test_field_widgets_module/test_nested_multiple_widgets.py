@@ -11,8 +11,12 @@ from pydantic import BaseModel
 from textual.widgets import Input
 
 from tests.app_with_form import MyApp
-from tests.test_field_widgets_module import check_state, click_option_container
-from ticklist.form import Form
+from tests.test_field_widgets_module import (
+    check_state,
+    check_states,
+    click_option_container,
+    type_text,
+)
 
 
 class MyModel(BaseModel):
@@ -42,33 +46,36 @@ class MyModelWithOptional(BaseModel):
     my_value: int | None = None
 
 
+_DEFAULT_A = MyModelWithDefault(my_value="A")
+_OPTIONAL_1 = MyModelWithOptional(my_value=1)
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "app,result,enabled",
     [
-        (MyApp(MyModel), {}, (False, False)),
-        (MyApp(MyModelWithDefault), {"my_value": "5"}, (False, True)),
+        ((MyModel, None), {}, (False, False)),
+        ((MyModelWithDefault, None), {"my_value": "5"}, (False, True)),
         (
-            MyApp(MyModelWithDefault, MyModelWithDefault(my_value="A")),
+            (MyModelWithDefault, _DEFAULT_A),
             {"my_value": "A"},
             (True, False),
         ),
-        (MyApp(MyModelWithOptional), {"my_value": None}, (False, True)),
+        ((MyModelWithOptional, None), {"my_value": None}, (False, True)),
         (
-            MyApp(MyModelWithOptional, MyModelWithOptional(my_value=1)),
+            (MyModelWithOptional, _OPTIONAL_1),
             {"my_value": "1"},
             (True, False),
         ),
     ],
+    indirect=["app"],
 )
 async def test_initial_values(app, result, enabled):
     """Form object has default model value at startup."""
     async with app.run_test():
-        my_form = app.query_one(Form)
-        option_1, option_2 = app.query(".option_container").nodes
+        my_form = app.current_form
 
-        check_state(option_1, enabled[0])
-        check_state(option_2, enabled[1])
+        check_states(app, enabled)
         assert my_form.obj == result
 
 
@@ -76,7 +83,7 @@ async def test_initial_values(app, result, enabled):
 async def test_manual_input():
     app = MyApp(MyModel)
     async with app.run_test() as pilot:
-        my_form = app.query_one(Form)
+        my_form = app.current_form
         option_1, int_input = app.query(".option_container").nodes
 
         # select the first option
@@ -89,7 +96,7 @@ async def test_manual_input():
         await click_option_container(int_input, pilot)
         inp = int_input.query_one(Input)
         inp.focus()
-        await pilot.press(*list("123"))
+        await type_text(inp, "123", pilot)
         check_state(option_1, False)
         check_state(int_input, True)
         assert my_form.obj == {"my_value": "123"}
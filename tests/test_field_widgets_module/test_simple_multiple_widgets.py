@@ -19,9 +19,11 @@ from typing import Literal
 import pytest
 from pydantic import BaseModel
 
-from tests.app_with_form import MyApp
-from tests.test_field_widgets_module import check_state, click_option_container
-from ticklist.form import Form
+from tests.test_field_widgets_module import (
+    check_state,
+    check_states,
+    click_option_container,
+)
 
 
 class LiteralModel(BaseModel):
@@ -30,13 +32,14 @@ class LiteralModel(BaseModel):
     my_value: Literal["A", "B"]
 
 
+class MyEnum(Enum):
+    A = "A"
+    B = "B"
+
+
 class EnumModelWithDefault(BaseModel):
     """Same as above, but with a default value and using enums."""
 
-    class MyEnum(Enum):
-        A = "A"
-        B = "B"
-
     my_value: MyEnum = MyEnum.B
 
 
@@ -44,45 +47,46 @@ class BooleanModel(BaseModel):
     my_value: bool
 
 
+_LITERAL_B = LiteralModel(my_value="B")
+_ENUM_A = EnumModelWithDefault(my_value=MyEnum.A)
+_BOOLEAN_TRUE = BooleanModel(my_value=True)
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "app,result,enabled",
     [
-        (MyApp(LiteralModel), {}, (False, False)),
+        ((LiteralModel, None), {}, (False, False)),
         (
-            MyApp(LiteralModel, LiteralModel(my_value="B")),
+            (LiteralModel, _LITERAL_B),
             {"my_value": "B"},
             (False, True),
         ),
         (
-            MyApp(EnumModelWithDefault),
-            {"my_value": EnumModelWithDefault.MyEnum.B},
+            (EnumModelWithDefault, None),
+            {"my_value": MyEnum.B},
             (False, True),
         ),
         (
-            MyApp(
-                EnumModelWithDefault,
-                EnumModelWithDefault(my_value=EnumModelWithDefault.MyEnum.A),
-            ),
-            {"my_value": EnumModelWithDefault.MyEnum.A},
+            (EnumModelWithDefault, _ENUM_A),
+            {"my_value": MyEnum.A},
             (True, False),
         ),
-        (MyApp(BooleanModel), {}, (False, False)),
+        ((BooleanModel, None), {}, (False, False)),
         (
-            MyApp(BooleanModel, BooleanModel(my_value=True)),
+            (BooleanModel, _BOOLEAN_TRUE),
             {"my_value": True},
             (True, False),
         ),
     ],
+    indirect=["app"],
 )
 async def test_initial_values(app, result, enabled):
     """Form object has default model value at startup."""
     async with app.run_test():
-        my_form = app.query_one(Form)
-        option_1, option_2 = app.query(".option_container").nodes
+        my_form = app.current_form
 
-        check_state(option_1, enabled[0])
-        check_state(option_2, enabled[1])
+        check_states(app, enabled)
         assert my_form.obj == result
 
 
@@ -90,13 +94,14 @@ async def test_initial_values(app, result, enabled):
 @pytest.mark.parametrize(
     "app,value",
     [
-        (MyApp(LiteralModel), "A"),
-        (MyApp(EnumModelWithDefault), EnumModelWithDefault.MyEnum.A),
+        ((LiteralModel, None), "A"),
+        ((EnumModelWithDefault, None), MyEnum.A),
     ],
+    indirect=["app"],
 )
 async def test_manual_input(app, value):
     async with app.run_test() as pilot:
-        my_form = app.query_one(Form)
+        my_form = app.current_form
         option_1, option_2 = app.query(".option_container").nodes
 
         await click_option_container(option_1, pilot)
@@ -3,45 +3,42 @@ from pydantic import BaseModel
 from textual.widgets import Input
 
 from tests.app_with_form import MyApp
+from tests.test_field_widgets_module import type_text
 from ticklist.form import Form
 
 
-class MyModel(BaseModel):
-    class SubModel(BaseModel):
-        my_value: str = "some_default"
+class SubModel(BaseModel):
+    my_value: str = "some_default"
+
 
+class MyModel(BaseModel):
     my_sub_model: SubModel
 
 
 class MyModelWithDefault(BaseModel):
-    class SubModel(BaseModel):
-        my_value: str = "some_default"
-
     my_sub_model: SubModel = SubModel()
 
 
+_DEFAULT_A = MyModelWithDefault(**{"my_sub_model": {"my_value": "A"}})
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "app,result",
     [
-        (MyApp(MyModel), {}),
-        (
-            MyApp(MyModelWithDefault),
-            {"my_sub_model": MyModelWithDefault.SubModel()},
-        ),
+        ((MyModel, None), {}),
+        ((MyModelWithDefault, None), {"my_sub_model": SubModel()}),
         (
-            MyApp(
-                MyModelWithDefault,
-                MyModelWithDefault(**{"my_sub_model": {"my_value": "A"}}),
-            ),
-            {"my_sub_model": MyModelWithDefault.SubModel(**{"my_value": "A"})},
+            (MyModelWithDefault, _DEFAULT_A),
+            {"my_sub_model": SubModel(**{"my_value": "A"})},
         ),
     ],
+    indirect=["app"],
 )
 async def test_initial_values(app, result):
     """Form object has default model value at startup."""
     async with app.run_test():
-        my_form = app.query_one(Form)
+        my_form = app.current_form
 
         assert my_form.obj == result
 
@@ -51,7 +48,7 @@ async def test_manual_input():
     app = MyApp(MyModel)
 
     async with app.run_test() as pilot:
-        my_main_model_form = app.query_one(Form)
+        my_main_model_form = app.current_form
         assert my_main_model_form.obj == {}
         # this will push a new form with SubModel as form data.
         await pilot.click("#edit_button")
@@ -65,7 +62,7 @@ async def test_manual_input():
         # Return to the previous screen (with model MyMainModel) but now by "OK".
         await pilot.click("#ok")
         assert my_main_model_form.obj == {
-            "my_sub_model": MyModel.SubModel(**{"my_value": "some_default"})
+            "my_sub_model": SubModel(**{"my_value": "some_default"})
         }
 
         # open the form again to edit the SubModel
@@ -74,24 +71,25 @@ async def test_manual_input():
         # cancel again
         await pilot.click("#cancel")
         assert my_main_model_form.obj == {
-            "my_sub_model": MyModel.SubModel(**{"my_value": "some_default"})
+            "my_sub_model": SubModel(**{"my_value": "some_default"})
         }
 
         # open the form again to edit the SubModel
         await pilot.click("#edit_button")
 
         # get the input field for the "my_value" property of the SubModel
-        sub_model_form = app.query(Form).last()
+        sub_model_form = app.screen
+        assert isinstance(sub_model_form, Form)
         inp = sub_model_form.query_one(Input)
         inp.clear()
         inp.focus()
 
-        await pilot.press(*list("Another value"))
+        await type_text(inp, "Another value", pilot)
         # we make sure the object is updated.
         assert sub_model_form.obj == {"my_value": "Another value"}
 
         # but we cancel and check whether we have still the previous value.
         await pilot.click("#cancel")
         assert my_main_model_form.obj == {
-            "my_sub_model": MyModel.SubModel(**{"my_value": "some_default"})
+            "my_sub_model": SubModel(**{"my_value": "some_default"})
         }
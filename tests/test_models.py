@@ -0,0 +1,42 @@
+from typing import Literal
+
+import pytest
+
+from ticklist.annotation_iterators import (
+    _MODEL_PLAN_CACHE,
+    ANNOTATION_ITERATORS,
+    StringAndLiteralAnnotationNotAllowed,
+    plan_for_model,
+)
+from ticklist.models import FormReadyModel
+
+
+def test_form_ready_model_plan_at_class_creation():
+    class MyModel(FormReadyModel):
+        my_value: str
+
+    plan = _MODEL_PLAN_CACHE[MyModel][ANNOTATION_ITERATORS]
+
+    assert plan_for_model(MyModel, ANNOTATION_ITERATORS) is plan
+
+
+def test_form_ready_model_not_complete():
+    class MyModel(FormReadyModel):
+        my_value: "Undefined"  # noqa: F821
+
+    assert MyModel not in _MODEL_PLAN_CACHE
+
+
+@pytest.mark.parametrize(
+    "annotation,error",
+    [(float, ValueError), (Literal["A"] | str, StringAndLiteralAnnotationNotAllowed)],
+)
+def test_form_ready_model_unsupported_field(annotation, error):
+    class MyModel(FormReadyModel):
+        my_value: annotation
+
+    assert MyModel not in _MODEL_PLAN_CACHE
+
+    with pytest.raises(error):
+        plan_for_model(MyModel, ANNOTATION_ITERATORS)
+    assert MyModel not in _MODEL_PLAN_CACHE
@@ -1,4 +1,12 @@
-from ticklist.tick_annotations import BooleanLabels, Label, to_tick_annotations
+import pytest
+
+from ticklist import tick_annotations as ta
+from ticklist.tick_annotations import (
+    BooleanLabels,
+    Label,
+    Multiline,
+    to_tick_annotations,
+)
 
 
 def test_tick_annotations_success():
@@ -10,3 +18,34 @@ def test_tick_annotations_success():
         "boolean_labels": BooleanLabels("YES", "NO"),
         "label": Label("mylabel"),
     }
+    assert to_tick_annotations(annotations) is tick_annotations
+
+
+def test_tick_annotations_subclass():
+    class MyLabel(Label):
+        pass
+
+    assert to_tick_annotations([MyLabel("mylabel"), Multiline(5)]) == {
+        "label": MyLabel("mylabel"),
+        "multiline": Multiline(5),
+    }
+
+
+def test_tick_annotations_unhashable():
+    assert to_tick_annotations([Label("mylabel"), ["unhashable"]]) == {
+        "label": Label("mylabel"),
+    }
+
+
+def test_tick_annotations_type_error_is_not_retried(monkeypatch):
+    calls = []
+
+    def _failing(annotations):
+        calls.append(annotations)
+        raise TypeError("failing")
+
+    monkeypatch.setattr(ta, "_tick_annotations", _failing)
+
+    with pytest.raises(TypeError, match="failing"):
+        to_tick_annotations([Label("not retried")])
+    assert len(calls) == 1